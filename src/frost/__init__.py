@@ -16,6 +16,8 @@ Modules:
   FROST scheme.
 - aggregator: Implements the Aggregator class to coordinate the aggregation of
   cryptographic elements.
+- lagrange: Provides the Lagrange coefficients used to combine contributions
+  of a set of participants.
 - constants: Holds cryptographic constants like P, Q, and G, crucial for
   elliptic curve operations.
 
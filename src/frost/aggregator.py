@@ -10,10 +10,18 @@ signature. It ensures that all components are correctly combined according to
 the FROST protocol.
 """
 
-from typing import Tuple, Optional
+import secrets
+from typing import Dict, Final, Tuple, Optional
 from hashlib import sha256
 from .point import Point, G
 from .constants import Q
+from . import lagrange
+
+# Size of a serialized nonce commitment pair (D_i, E_i): two SEC 1 compressed points
+_NONCE_COMMITMENT_PAIR_SIZE: Final[int] = 2 * 33
+
+# The BIP340 tagged hash prefix for challenges: SHA256(tag) || SHA256(tag)
+_CHALLENGE_TAG_PREFIX: Final[bytes] = sha256(b"BIP0340/challenge").digest() * 2
 
 
 class Aggregator:
@@ -59,6 +67,7 @@ class Aggregator:
 
         self.tweaked_key = None
         self.tweak = None
+        self._bip32_parity = 0
 
         if (bip32_tweak is None) != (taproot_tweak is None):
             raise ValueError(
@@ -66,11 +75,20 @@ class Aggregator:
             )
 
         if bip32_tweak is not None and taproot_tweak is not None:
-            tweaked_key, tweak, _ = self._compute_tweaks(
+            tweaked_key, tweak, bip32_parity = self._compute_tweaks(
                 bip32_tweak, taproot_tweak, public_key
             )
             self.tweaked_key = tweaked_key
             self.tweak = tweak
+            self._bip32_parity = bip32_parity
+
+        # p_l, l ∈ S and R, computed on first use together with the (m, B, S)
+        # they were derived from
+        self._binding_values_cache: Optional[Dict[int, int]] = None
+        self._group_commitment_cache: Optional[Point] = None
+        self._group_commitment_inputs: Optional[
+            Tuple[bytes, Tuple[Tuple[Point, Point], ...], Tuple[int, ...]]
+        ] = None
 
     @classmethod
     def tweak_key(
@@ -102,21 +120,49 @@ class Aggregator:
         Raises:
         ValueError: If any participant index is out of the expected range.
         """
-        # R
-        group_commitment = Point()  # Point at infinity
-        for index in participant_indexes:
-            if index < 1 or index > len(nonce_commitment_pairs):
-                raise ValueError(f"Participant index {index} is out of range.")
+        # p_l = H_1(l, m, B), l ∈ S
+        binding_values = cls._binding_values(
+            message, nonce_commitment_pairs, participant_indexes
+        )
 
-            # p_l = H_1(l, m, B), l ∈ S
-            binding_value = cls.binding_value(
-                index, message, nonce_commitment_pairs, participant_indexes
-            )
+        return cls._combine_commitments(
+            nonce_commitment_pairs, participant_indexes, binding_values
+        )
+
+    @classmethod
+    def _combine_commitments(
+        cls,
+        nonce_commitment_pairs: Tuple[Tuple[Point, Point], ...],
+        participant_indexes: Tuple[int, ...],
+        binding_values: Dict[int, int],
+    ) -> Point:
+        """
+        Combine the nonce commitments of the participants into the group
+        commitment, given their already computed binding values.
+
+        Parameters:
+        nonce_commitment_pairs (Tuple[Tuple[Point, Point], ...]): A tuple containing pairs of
+        nonce commitments for each participant.
+        participant_indexes (Tuple[int, ...]): Indices of participants involved in the signature.
+        binding_values (Dict[int, int]): The binding value of each participant, keyed by index.
+
+        Returns:
+        Point: The aggregated group commitment as a point on the elliptic curve.
+        """
+        first_commitments = []
+        second_commitments = []
+        for index in participant_indexes:
             # D_l, E_l
             first_commitment, second_commitment = nonce_commitment_pairs[index - 1]
-
-            # R = ∏ D_l * (E_l)^p_l, l ∈ S
-            group_commitment += first_commitment + (binding_value * second_commitment)
+            first_commitments.append(first_commitment)
+            second_commitments.append(second_commitment)
+
+        # R = ∏ D_l * (E_l)^p_l, l ∈ S
+        group_commitment = Point.multi_scalar_mul(
+            [1] * len(first_commitments)
+            + [binding_values[index] for index in participant_indexes],
+            first_commitments + second_commitments,
+        )
 
         return group_commitment
 
@@ -139,7 +185,7 @@ class Aggregator:
         participant_indexes (Tuple[int, ...]): The indices of participants involved
         in the operation.
 
-        Returns: int: The resulting binding value as an integer.
+        Returns: int: The resulting binding value as an integer, reduced by modulo Q.
 
         Raises:
         ValueError: If any index is out of the expected range.
@@ -147,28 +193,143 @@ class Aggregator:
         if index < 1:
             raise ValueError("Participant index must start from 1.")
 
-        binding_value = sha256()
-        # l
-        index_byte = index.to_bytes(1, "big")
+        # B
+        nonce_commitment_pairs_bytes = cls._encode_nonce_commitment_pairs(
+            nonce_commitment_pairs, participant_indexes
+        )
+
+        return cls._hash_binding_values(
+            (index,), message, nonce_commitment_pairs_bytes
+        )[index]
 
+    @classmethod
+    def _binding_values(
+        cls,
+        message: bytes,
+        nonce_commitment_pairs: Tuple[Tuple[Point, Point], ...],
+        participant_indexes: Tuple[int, ...],
+    ) -> Dict[int, int]:
+        """
+        Compute the binding values of all participants involved in the
+        signature, serializing the nonce commitments only once.
+
+        Parameters:
+        message (bytes): The message being signed.
+        nonce_commitment_pairs (Tuple[Tuple[Point, Point], ...]): A tuple containing pairs of
+        nonce commitments for each participant.
+        participant_indexes (Tuple[int, ...]): Indices of participants involved in the signature.
+
+        Returns:
+        Dict[int, int]: The binding value of each participant, keyed by index.
+
+        Raises:
+        ValueError: If any index is out of the expected range.
+        """
         # B
-        nonce_commitment_pairs_bytes = []
+        nonce_commitment_pairs_bytes = cls._encode_nonce_commitment_pairs(
+            nonce_commitment_pairs, participant_indexes
+        )
+
+        return cls._hash_binding_values(
+            participant_indexes, message, nonce_commitment_pairs_bytes
+        )
+
+    @classmethod
+    def _encode_nonce_commitment_pairs(
+        cls,
+        nonce_commitment_pairs: Tuple[Tuple[Point, Point], ...],
+        participant_indexes: Tuple[int, ...],
+    ) -> bytes:
+        """
+        Serialize the nonce commitments of the participants involved in the
+        signature, in the order of their indexes.
+
+        Parameters:
+        nonce_commitment_pairs (Tuple[Tuple[Point, Point], ...]): A tuple containing pairs of
+        nonce commitments for each participant.
+        participant_indexes (Tuple[int, ...]): Indices of participants involved in the signature.
+
+        Returns:
+        bytes: The concatenated SEC 1 serializations of each D_l and E_l.
+
+        Raises:
+        ValueError: If any index is out of the expected range.
+        """
+        cls._check_participant_indexes(len(nonce_commitment_pairs), participant_indexes)
+
+        size = _NONCE_COMMITMENT_PAIR_SIZE
+        half = size // 2
+        nonce_commitment_pairs_bytes = bytearray(size * len(participant_indexes))
+        offset = 0
         for idx in participant_indexes:
-            if idx < 1 or idx > len(nonce_commitment_pairs):
-                raise ValueError(f"Index {idx} is out of range for nonce commitments.")
-            participant_pair = nonce_commitment_pairs[idx - 1]
-            participant_pair_bytes = b"".join(
-                [commitment.sec_serialize() for commitment in participant_pair]
+            first_commitment, second_commitment = nonce_commitment_pairs[idx - 1]
+            nonce_commitment_pairs_bytes[offset : offset + half] = (
+                first_commitment.sec_serialize()
+            )
+            nonce_commitment_pairs_bytes[offset + half : offset + size] = (
+                second_commitment.sec_serialize()
             )
-            nonce_commitment_pairs_bytes.append(participant_pair_bytes)
+            offset += size
+
+        return bytes(nonce_commitment_pairs_bytes)
+
+    @classmethod
+    def _check_participant_indexes(
+        cls, pair_count: int, participant_indexes: Tuple[int, ...]
+    ) -> None:
+        """
+        Check that every participant index refers to a nonce commitment pair,
+        once for the whole session rather than per participant.
+
+        Parameters:
+        pair_count (int): The number of nonce commitment pairs.
+        participant_indexes (Tuple[int, ...]): Indices of participants involved in the signature.
+
+        Raises:
+        ValueError: If any index is out of the expected range.
+        """
+        if not participant_indexes:
+            return
+        if min(participant_indexes) >= 1 and max(participant_indexes) <= pair_count:
+            return
+
+        idx = next(idx for idx in participant_indexes if idx < 1 or idx > pair_count)
+        raise ValueError(f"Index {idx} is out of range for nonce commitments.")
+
+    @classmethod
+    def _hash_binding_values(
+        cls,
+        indexes: Tuple[int, ...],
+        message: bytes,
+        nonce_commitment_pairs_bytes: bytes,
+    ) -> Dict[int, int]:
+        """
+        Hash the binding values of the given participants from the already
+        serialized nonce commitments.
+
+        The transcripts only differ in their leading index byte, so the (m, B)
+        suffix is built once and each index byte is prepended to it.
+
+        Parameters:
+        indexes (Tuple[int, ...]): The indexes of the participants.
+        message (bytes): The message being signed.
+        nonce_commitment_pairs_bytes (bytes): The serialized nonce commitments B.
+
+        Returns:
+        Dict[int, int]: The binding value of each participant, keyed by index.
+        """
+        # (m, B)
+        suffix = message + nonce_commitment_pairs_bytes
 
         # p_l = H_1(l, m, B), l ∈ S
-        binding_value.update(index_byte)
-        binding_value.update(message)
-        binding_value.update(b"".join(nonce_commitment_pairs_bytes))
-        binding_value_bytes = binding_value.digest()
+        binding_values_bytes = [
+            sha256(index.to_bytes(1, "big") + suffix).digest() for index in indexes
+        ]
 
-        return int.from_bytes(binding_value_bytes, "big")
+        return {
+            index: int.from_bytes(binding_value_bytes, "big") % Q
+            for index, binding_value_bytes in zip(indexes, binding_values_bytes)
+        }
 
     @classmethod
     def challenge_hash(
@@ -187,14 +348,12 @@ class Aggregator:
         int: The resulting challenge hash value as an integer, reduced by modulo Q.
         """
         # c = H_2(R, Y, m)
-        tag_hash = sha256(b"BIP0340/challenge").digest()
-        challenge_hash = sha256()
-        challenge_hash.update(tag_hash)
-        challenge_hash.update(tag_hash)
-        challenge_hash.update(nonce_commitment.xonly_serialize())
-        challenge_hash.update(public_key.xonly_serialize())
-        challenge_hash.update(message)
-        challenge_hash_bytes = challenge_hash.digest()
+        challenge_hash_bytes = sha256(
+            _CHALLENGE_TAG_PREFIX
+            + nonce_commitment.xonly_serialize()
+            + public_key.xonly_serialize()
+            + message
+        ).digest()
 
         return int.from_bytes(challenge_hash_bytes, "big") % Q
 
@@ -211,11 +370,7 @@ class Aggregator:
         Point: The derived shared secret as a point on the elliptic curve.
         """
         # K = ∑ K_i, i ∈ S
-        shared_secret = Point()
-        for shared_secret_share in shared_secret_shares:
-            shared_secret += shared_secret_share
-
-        return shared_secret
+        return Point.sum(shared_secret_shares)
 
     def signing_inputs(self) -> Tuple[bytes, Tuple[Tuple[Point, Point], ...]]:
         """
@@ -230,23 +385,38 @@ class Aggregator:
         # (m, B)
         return (self.message, self.nonce_commitment_pairs)
 
-    def signature(self, signature_shares: Tuple[int, ...]) -> str:
+    def signature(
+        self,
+        signature_shares: Tuple[int, ...],
+        public_verification_shares: Optional[Tuple[Point, ...]] = None,
+    ) -> str:
         """
         Compute the final signature from the aggregated signature shares.
 
         Parameters:
         signature_shares (Tuple[int, ...]): Tuple of signature shares from all participating members.
+        public_verification_shares (Optional[Tuple[Point, ...]]): Optional
+        public verification shares Y_l of the participating members, in the
+        order of the participant indexes. If provided, the signature shares
+        are verified before they are aggregated.
 
         Returns:
         str: The final signature in hexadecimal format.
+
+        Raises:
+        ValueError: If the signature shares do not verify against the public
+        verification shares.
         """
         # R
-        group_commitment = self.group_commitment(
-            self.message, self.nonce_commitment_pairs, self.participant_indexes
-        )
+        group_commitment = self._compute_group_commitment()
         nonce_commitment = group_commitment.xonly_serialize()
 
-        # TODO: verify each signature share
+        if public_verification_shares is not None:
+            if not self._verify_signature_shares(
+                signature_shares, public_verification_shares
+            ):
+                raise ValueError("Invalid signature shares.")
+
         z = sum(signature_shares) % Q
 
         if self.tweak and self.tweaked_key:
@@ -258,6 +428,124 @@ class Aggregator:
         # σ = (R, z)
         return (nonce_commitment + z.to_bytes(32, "big")).hex()
 
+    def _verify_signature_shares(
+        self,
+        signature_shares: Tuple[int, ...],
+        public_verification_shares: Tuple[Point, ...],
+    ) -> bool:
+        """
+        Verify all signature shares at once with a random linear combination.
+
+        Each share must satisfy g^z_l = R_l * Y_l^(c * λ_l), with R_l = D_l *
+        E_l^p_l and the same negations the signers apply for odd R and Y.
+        Instead of checking these α equations one by one, they are weighted
+        by random 128-bit scalars r_l and summed, so a single multi-scalar
+        multiplication checks them all. An invalid share passes with
+        probability at most 2^-128.
+
+        Parameters:
+        signature_shares (Tuple[int, ...]): The signature shares z_l.
+        public_verification_shares (Tuple[Point, ...]): The public
+        verification shares Y_l, in the order of the participant indexes.
+
+        Returns:
+        bool: True if all signature shares are valid, False otherwise.
+
+        Raises:
+        ValueError: If duplicate participant indices are found.
+        """
+        participant_indexes = self.participant_indexes
+        if len(signature_shares) != len(participant_indexes) or len(
+            public_verification_shares
+        ) != len(participant_indexes):
+            return False
+
+        if len(participant_indexes) != len(set(participant_indexes)):
+            raise ValueError("Participant indexes must be unique.")
+
+        # R
+        group_commitment = self._compute_group_commitment()
+        # p_l, l ∈ S
+        binding_values = self._binding_values_cache
+        if group_commitment.y is None or binding_values is None:
+            return False
+
+        public_key = self.public_key
+        if self.tweaked_key is not None:
+            public_key = self.tweaked_key
+        if public_key.y is None:
+            return False
+
+        # c = H_2(R, Y, m)
+        challenge_hash = self.challenge_hash(group_commitment, public_key, self.message)
+
+        # Signers negate their nonces if R is odd and their shares if Y is odd
+        nonce_sign = -1 if group_commitment.y % 2 != 0 else 1
+        share_sign = -1 if public_key.y % 2 != self._bip32_parity else 1
+
+        # ∑ r_l * z_l * G = ∑ r_l * (±(D_l + p_l * E_l) ± c * λ_l * Y_l)
+        z = 0
+        scalars = []
+        points = []
+        for index, signature_share, public_verification_share in zip(
+            participant_indexes, signature_shares, public_verification_shares
+        ):
+            r = secrets.randbits(128)
+            first_commitment, second_commitment = self.nonce_commitment_pairs[index - 1]
+            # λ_l
+            lagrange_coefficient = lagrange.lagrange_coefficient(
+                index, participant_indexes
+            )
+
+            z += r * signature_share
+            scalars.append(nonce_sign * r)
+            points.append(first_commitment)
+            scalars.append(nonce_sign * r * binding_values[index])
+            points.append(second_commitment)
+            scalars.append(share_sign * r * challenge_hash * lagrange_coefficient)
+            points.append(public_verification_share)
+
+        return z * G == Point.multi_scalar_mul(scalars, points)
+
+    def _compute_group_commitment(self) -> Point:
+        """
+        Compute the group commitment of this signing session, reusing the
+        binding values and group commitment from a previous call as long as
+        the message, nonce commitments and participant indexes are unchanged.
+
+        Returns:
+        Point: The aggregated group commitment as a point on the elliptic curve.
+
+        Raises:
+        ValueError: If any participant index is out of the expected range.
+        """
+        inputs = (
+            self.message,
+            tuple(self.nonce_commitment_pairs),
+            tuple(self.participant_indexes),
+        )
+        if (
+            self._group_commitment_cache is None
+            or self._group_commitment_inputs != inputs
+        ):
+            # B
+            nonce_commitment_pairs_bytes = self._encode_nonce_commitment_pairs(
+                self.nonce_commitment_pairs, self.participant_indexes
+            )
+            # p_l = H_1(l, m, B), l ∈ S
+            self._binding_values_cache = self._hash_binding_values(
+                self.participant_indexes, self.message, nonce_commitment_pairs_bytes
+            )
+            # R
+            self._group_commitment_cache = self._combine_commitments(
+                self.nonce_commitment_pairs,
+                self.participant_indexes,
+                self._binding_values_cache,
+            )
+            self._group_commitment_inputs = inputs
+
+        return self._group_commitment_cache
+
     @classmethod
     def _compute_tweaks(
         cls, bip32_tweak: int, taproot_tweak: int, public_key: Point
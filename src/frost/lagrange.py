@@ -0,0 +1,40 @@
+"""
+This module provides Lagrange interpolation over the scalar field of
+secp256k1, shared by the participants and the aggregator of the FROST
+signature scheme to weight contributions of a set of participants.
+"""
+
+from typing import Tuple
+from .constants import Q
+
+
+def lagrange_coefficient(
+    participant_index: int, participant_indexes: Tuple[int, ...], x: int = 0
+) -> int:
+    """
+    Calculate the Lagrange coefficient of a participant relative to other
+    participants, evaluated at x.
+
+    The participant indexes are expected to be unique; callers are responsible
+    for checking this once for the whole set.
+
+    Parameters:
+    participant_index (int): The index of the participant for which the
+    coefficient is calculated.
+    participant_indexes (Tuple[int, ...]): The indexes of all participants
+    involved in the calculation.
+    x (int, optional): The point at which the polynomial is evaluated.
+    Defaults to 0, representing the polynomial's constant term.
+
+    Returns:
+    int: The Lagrange coefficient, reduced modulo Q.
+    """
+    # λ_i(x) = ∏ (x - p_j)/(p_i - p_j), 1 ≤ j ≤ α, j ≠ i
+    numerator = 1
+    denominator = 1
+    for index in participant_indexes:
+        if index == participant_index:
+            continue
+        numerator = numerator * (x - index)
+        denominator = denominator * (participant_index - index)
+    return (numerator * pow(denominator, Q - 2, Q)) % Q
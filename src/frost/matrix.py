@@ -95,10 +95,9 @@ class Matrix:
         for a_row in self.matrix:
             row_result = []
             for j in range(len(Y[0])):
-                sum_point = Point()  # Point at infinity
-                for k, scalar in enumerate(a_row):
-                    point = Y[k][j]
-                    sum_point += scalar * point
+                sum_point = Point.multi_scalar_mul(
+                    a_row, [Y[k][j] for k in range(len(a_row))]
+                )
                 row_result.append(sum_point)
             result.append(tuple(row_result))
         return tuple(result)
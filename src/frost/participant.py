@@ -17,6 +17,7 @@ from .constants import Q
 from .point import Point, G
 from .aggregator import Aggregator
 from .matrix import Matrix
+from . import lagrange
 
 
 class Participant:
@@ -380,17 +381,14 @@ class Participant:
             dealer_public_share = self.derive_public_verification_share(
                 group_commitments, dealer_index, self.threshold
             )
-            if lagrange_coefficient * dealer_public_share != sum(commitments, Point()):
+            if lagrange_coefficient * dealer_public_share != Point.sum(commitments):
                 return False
 
-        aggregate_repair_share_commitment = sum(
-            tuple(
-                self.get_repair_share_commitment(
-                    aggregator_index, commitments, repair_participants
-                )
-                for commitments in repair_share_commitments
-            ),
-            Point(),
+        aggregate_repair_share_commitment = Point.sum(
+            self.get_repair_share_commitment(
+                aggregator_index, commitments, repair_participants
+            )
+            for commitments in repair_share_commitments
         )
 
         return aggregate_repair_share * G == aggregate_repair_share_commitment
@@ -438,8 +436,8 @@ class Participant:
         dealer_public_share = self.derive_public_verification_share(
             self.group_commitments, dealer_index, self.threshold
         )
-        return lagrange_coefficient * dealer_public_share == sum(
-            repair_share_commitments, Point()
+        return lagrange_coefficient * dealer_public_share == Point.sum(
+            repair_share_commitments
         )
 
     def _evaluate_polynomial(self, x: int) -> int:
@@ -495,15 +493,7 @@ class Participant:
         if participant_index is None:
             participant_index = self.index
 
-        # λ_i(x) = ∏ (x - p_j)/(p_i - p_j), 1 ≤ j ≤ α, j ≠ i
-        numerator = 1
-        denominator = 1
-        for index in participant_indexes:
-            if index == participant_index:
-                continue
-            numerator = numerator * (x - index)
-            denominator = denominator * (participant_index - index)
-        return (numerator * pow(denominator, Q - 2, Q)) % Q
+        return lagrange.lagrange_coefficient(participant_index, participant_indexes, x)
 
     def verify_share(
         self, share: int, coefficient_commitments: Tuple[Point, ...], threshold: int
@@ -738,11 +728,11 @@ class Participant:
                 "The number of coefficient commitments must match the threshold."
             )
 
-        expected_y_commitment = Point()  # Point at infinity
-        for k, commitment in enumerate(coefficient_commitments):
-            expected_y_commitment += (index**k % Q) * commitment
-
-        return expected_y_commitment
+        # Y_i = ∏ 𝜙_k^(i^k), 0 ≤ k ≤ t - 1
+        return Point.multi_scalar_mul(
+            [pow(index, k, Q) for k in range(len(coefficient_commitments))],
+            coefficient_commitments,
+        )
 
     def derive_public_key(self, other_secret_commitments: Tuple[Point, ...]) -> Point:
         """
@@ -806,7 +796,7 @@ class Participant:
             )
 
         group_commitments = tuple(
-            sum(commitments, Point())
+            Point.sum(commitments)
             for commitments in zip(
                 *(other_coefficient_commitments + (self.coefficient_commitments,))
             )
@@ -814,7 +804,7 @@ class Participant:
 
         if self.group_commitments is not None:
             self.group_commitments = tuple(
-                sum(commitments, Point())
+                Point.sum(commitments)
                 for commitments in zip(self.group_commitments, group_commitments)
             )
         else:
@@ -9,7 +9,8 @@ such as point doubling, scalar multiplication, and checks for the point at infin
 """
 
 from __future__ import annotations
-from typing import Optional
+from functools import lru_cache
+from typing import Final, Iterable, Optional, Sequence, Tuple
 from .constants import P, Q, G_x, G_y
 
 
@@ -31,6 +32,8 @@ class Point:
 
         self.x = x
         self.y = y
+        # Memoized SEC 1 encoding, stored with the coordinates it encodes
+        self._sec_cache: Optional[Tuple[int, int, bytes]] = None
 
     @classmethod
     def sec_deserialize(cls, hex_public_key: str) -> Point:
@@ -77,6 +80,10 @@ class Point:
         """
         Serialize the point to its SEC 1 compressed format.
 
+        The encoding is memoized on the instance, so points that are serialized
+        repeatedly (e.g. nonce commitments hashed into every binding value) are
+        only encoded once.
+
         Returns:
         bytes: The SEC 1 compressed format of the point, consisting of a prefix
         and the x-coordinate.
@@ -87,8 +94,14 @@ class Point:
         if self.x is None or self.y is None:
             raise ValueError("Cannot serialize the point at infinity.")
 
+        cache = self._sec_cache
+        if cache is not None and cache[0] == self.x and cache[1] == self.y:
+            return cache[2]
+
         prefix = b"\x02" if self.y % 2 == 0 else b"\x03"
-        return prefix + self.x.to_bytes(32, "big")
+        serialized = prefix + self.x.to_bytes(32, "big")
+        self._sec_cache = (self.x, self.y, serialized)
+        return serialized
 
     @classmethod
     def xonly_deserialize(cls, hex_public_key: str) -> Point:
@@ -256,6 +269,9 @@ class Point:
         Multiply this point by an integer scalar using the double-and-add
         method, reduced modulo the curve order.
 
+        Multiplications of the generator G use a fixed-base table of its
+        precomputed multiples instead, which needs no doublings at all.
+
         Parameters:
         scalar (int): The scalar to multiply this point by.
 
@@ -271,6 +287,10 @@ class Point:
         if not isinstance(scalar, int):
             raise ValueError("The scalar must be an integer")
 
+        # Multiples of the generator are looked up in a precomputed table
+        if self.x == G_x and self.y == G_y:
+            return _from_jacobian(self.__class__, _generator_mul(scalar))
+
         p = self
         r = self.__class__()
         i = 1
@@ -283,6 +303,80 @@ class Point:
 
         return r
 
+    @classmethod
+    def sum(cls, points: Iterable[Point]) -> Point:
+        """
+        Add up a collection of points.
+
+        The running total is kept in Jacobian coordinates, so only a single
+        modular inversion is needed for the whole sum instead of one per
+        addition.
+
+        Parameters:
+        points (Iterable[Point]): The points to add.
+
+        Returns:
+        Point: The sum of the points, or the point at infinity if there are none.
+        """
+        result = _JACOBIAN_INFINITY
+        for point in points:
+            if point.x is None or point.y is None:
+                continue
+            result = _jacobian_add(result, (point.x, point.y, 1))
+
+        return _from_jacobian(cls, result)
+
+    @classmethod
+    def multi_scalar_mul(cls, scalars: Sequence[int], points: Sequence[Point]) -> Point:
+        """
+        Compute the sum of scalar multiplications ∑ k_i * P_i with a single
+        shared chain of doublings (Straus' method).
+
+        Each point gets a small table of its multiples, then the scalars are
+        processed window by window from the most significant bits, so the
+        doublings are paid once for all terms instead of once per term.
+        Intermediate results are kept in Jacobian coordinates to avoid a
+        modular inversion for every addition.
+
+        Parameters:
+        scalars (Sequence[int]): The scalars k_i, reduced modulo the curve order.
+        points (Sequence[Point]): The points P_i to multiply.
+
+        Returns:
+        Point: The resulting point ∑ k_i * P_i.
+
+        Raises:
+        ValueError: If the number of scalars does not match the number of points.
+        """
+        if len(scalars) != len(points):
+            raise ValueError("The number of scalars must match the number of points.")
+
+        terms = []
+        for scalar, point in zip(scalars, points):
+            scalar = scalar % Q
+            # Terms that vanish cost neither a table nor any additions
+            if scalar == 0 or point.x is None or point.y is None:
+                continue
+            # Small scalars, e.g. 1 for plain additions, only need a short table
+            table_size = min(scalar, (1 << _WINDOW_BITS) - 1) + 1
+            terms.append((scalar, _window_table(point.x, point.y, table_size)))
+
+        if not terms:
+            return cls()
+
+        mask = (1 << _WINDOW_BITS) - 1
+        bits = max(scalar.bit_length() for scalar, _ in terms)
+        result = _JACOBIAN_INFINITY
+        for window in reversed(range(0, bits, _WINDOW_BITS)):
+            for _ in range(_WINDOW_BITS):
+                result = _jacobian_double(result)
+            for scalar, table in terms:
+                digit = (scalar >> window) & mask
+                if digit:
+                    result = _jacobian_add(result, table[digit])
+
+        return _from_jacobian(cls, result)
+
     def __str__(self) -> str:
         """
         Return a human-readable string representation of the point.
@@ -306,4 +400,118 @@ class Point:
 
 
 # The generator point G
-G: Point = Point(G_x, G_y)
+G: Final[Point] = Point(G_x, G_y)
+
+
+# Width in bits of the scalar windows used by Point.multi_scalar_mul
+_WINDOW_BITS: Final[int] = 4
+
+# Jacobian coordinates (X, Y, Z) represent the affine point (X / Z², Y / Z³)
+_JacobianPoint = Tuple[int, int, int]
+
+# The point at infinity in Jacobian coordinates
+_JACOBIAN_INFINITY: Final[_JacobianPoint] = (1, 1, 0)
+
+
+def _jacobian_double(p: _JacobianPoint) -> _JacobianPoint:
+    """Double a point given in Jacobian coordinates."""
+    x, y, z = p
+    if z == 0 or y == 0:
+        return _JACOBIAN_INFINITY
+
+    y_squared = y * y % P
+    s = 4 * x * y_squared % P
+    m = 3 * x * x % P
+    sum_x = (m * m - 2 * s) % P
+    sum_y = (m * (s - sum_x) - 8 * y_squared * y_squared) % P
+    sum_z = 2 * y * z % P
+
+    return sum_x, sum_y, sum_z
+
+
+def _jacobian_add(p: _JacobianPoint, q: _JacobianPoint) -> _JacobianPoint:
+    """Add two points given in Jacobian coordinates."""
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    if z1 == 0:
+        return q
+    if z2 == 0:
+        return p
+
+    z1_squared = z1 * z1 % P
+    z2_squared = z2 * z2 % P
+    u1 = x1 * z2_squared % P
+    u2 = x2 * z1_squared % P
+    s1 = y1 * z2_squared * z2 % P
+    s2 = y2 * z1_squared * z1 % P
+    if u1 == u2:
+        if s1 != s2:
+            return _JACOBIAN_INFINITY
+        return _jacobian_double(p)
+
+    h = (u2 - u1) % P
+    r = (s2 - s1) % P
+    h_squared = h * h % P
+    h_cubed = h_squared * h % P
+    u1_h_squared = u1 * h_squared % P
+    sum_x = (r * r - h_cubed - 2 * u1_h_squared) % P
+    sum_y = (r * (u1_h_squared - sum_x) - s1 * h_cubed) % P
+    sum_z = h * z1 * z2 % P
+
+    return sum_x, sum_y, sum_z
+
+
+def _from_jacobian(cls: type, p: _JacobianPoint) -> Point:
+    """Convert a point in Jacobian coordinates back to an affine Point."""
+    x, y, z = p
+    if z == 0:
+        return cls()
+
+    z_inv = pow(z, P - 2, P)
+    z_inv_squared = z_inv * z_inv % P
+
+    return cls(x * z_inv_squared % P, y * z_inv_squared * z_inv % P)
+
+
+def _window_table(x: int, y: int, size: int) -> Tuple[_JacobianPoint, ...]:
+    """Compute the multiples 0 * P, 1 * P, ..., (size - 1) * P of an affine point."""
+    base = (x, y, 1)
+    table = [_JACOBIAN_INFINITY, base]
+    for _ in range(2, size):
+        table.append(_jacobian_add(table[-1], base))
+
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def _generator_table() -> Tuple[Tuple[_JacobianPoint, ...], ...]:
+    """
+    Compute the fixed-base table of the generator: row i holds the multiples
+    d * 2^(w * i) * G for every w-bit digit d.
+    """
+    rows = []
+    base = (G_x, G_y, 1)
+    for _ in range(0, Q.bit_length(), _WINDOW_BITS):
+        row = [_JACOBIAN_INFINITY, base]
+        for _ in range(2, 1 << _WINDOW_BITS):
+            row.append(_jacobian_add(row[-1], base))
+        rows.append(tuple(row))
+        for _ in range(_WINDOW_BITS):
+            base = _jacobian_double(base)
+
+    return tuple(rows)
+
+
+def _generator_mul(scalar: int) -> _JacobianPoint:
+    """Multiply the generator by a scalar in [0, Q) using its fixed-base table."""
+    mask = (1 << _WINDOW_BITS) - 1
+    result = _JACOBIAN_INFINITY
+    for row in _generator_table():
+        if not scalar:
+            break
+        digit = scalar & mask
+        if digit:
+            result = _jacobian_add(result, row[digit])
+        scalar >>= _WINDOW_BITS
+
+    return result
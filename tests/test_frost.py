@@ -185,6 +185,14 @@ class Tests(unittest.TestCase):
 
         # σ = (R, z)
         sig = agg.signature((s1, s2))
+        self.assertEqual(agg.signature((s1, s2)), sig)
+        public_verification_shares = (
+            p1.public_verification_share(),
+            p2.public_verification_share(),
+        )
+        self.assertEqual(agg.signature((s1, s2), public_verification_shares), sig)
+        with self.assertRaises(ValueError):
+            agg.signature((s1, (s2 + 1) % Q), public_verification_shares)
         sig_bytes = bytes.fromhex(sig)
         nonce_commitment = Point.xonly_deserialize(sig_bytes[0:32].hex())
         z = int.from_bytes(sig_bytes[32:64], "big")
@@ -243,6 +251,13 @@ class Tests(unittest.TestCase):
 
         # σ = (R, z)
         sig = agg.signature((s1, s2))
+        public_verification_shares = (
+            p1.public_verification_share(),
+            p2.public_verification_share(),
+        )
+        self.assertEqual(agg.signature((s1, s2), public_verification_shares), sig)
+        with self.assertRaises(ValueError):
+            agg.signature((s1, (s2 + 1) % Q), public_verification_shares)
         sig_bytes = bytes.fromhex(sig)
         nonce_commitment = Point.xonly_deserialize(sig_bytes[0:32].hex())
         z = int.from_bytes(sig_bytes[32:64], "big")
@@ -1014,3 +1029,140 @@ class Tests(unittest.TestCase):
         )
 
         self.assertEqual(shared_secret, alice_private_key * p1.public_key)
+
+    def test_multi_scalar_mul(self):
+        points = tuple(secrets.randbits(256) % Q * G for _ in range(4)) + (Point(),)
+        scalars = tuple(secrets.randbits(256) for _ in range(4)) + (7,)
+
+        expected = Point()
+        for scalar, point in zip(scalars, points):
+            expected += scalar * point
+
+        self.assertEqual(Point.multi_scalar_mul(scalars, points), expected)
+        self.assertEqual(Point.multi_scalar_mul((1, Q - 1), (G, G)), Point())
+        self.assertEqual(Point.multi_scalar_mul((), ()), Point())
+        self.assertEqual(Point.multi_scalar_mul((Q, 0), (G, G)), Point())
+
+    def test_point_sum(self):
+        points = tuple(secrets.randbits(256) % Q * G for _ in range(4))
+
+        expected = Point()
+        for point in points:
+            expected += point
+
+        self.assertEqual(Point.sum(points), expected)
+        self.assertEqual(
+            Point.sum(points + (Point(), -points[0])), expected - points[0]
+        )
+        self.assertEqual(Point.sum((G, G)), 2 * G)
+        self.assertEqual(Point.sum(()), Point())
+
+    def test_generator_mul(self):
+        for scalar in (0, 1, 2, Q - 1, Q, Q + 1, secrets.randbits(256)):
+            self.assertEqual(scalar * G, Point.multi_scalar_mul((scalar,), (G,)))
+
+        self.assertEqual(3 * Point(G.x, G.y), G + G + G)
+
+    def test_group_commitment_index_out_of_range(self):
+        self.p1.generate_nonce_pair()
+        nonce_commitment_pairs = (self.p1.nonce_commitment_pair,)
+
+        for participant_indexes in ((0,), (2,), (1, 2)):
+            with self.assertRaises(ValueError):
+                Aggregator.group_commitment(
+                    b"fnord!", nonce_commitment_pairs, participant_indexes
+                )
+
+    def test_group_commitment_single_participant(self):
+        self.p1.generate_nonce_pair()
+        nonce_commitment_pairs = (self.p1.nonce_commitment_pair,)
+        first_commitment, second_commitment = self.p1.nonce_commitment_pair
+
+        binding_value = Aggregator.binding_value(
+            1, b"fnord!", nonce_commitment_pairs, (1,)
+        )
+        self.assertEqual(
+            Aggregator.group_commitment(b"fnord!", nonce_commitment_pairs, (1,)),
+            first_commitment + binding_value * second_commitment,
+        )
+
+    def test_sign_participant_subset(self):
+        p1 = self.p1
+        p3 = self.p3
+
+        pk = p1.public_key
+
+        p1.generate_nonce_pair()
+        p3.generate_nonce_pair()
+
+        # Slot 2 does not take part, so its nonce commitments are never used
+        msg = b"fnord!"
+        participant_indexes = (3, 1)
+        agg = Aggregator(
+            pk,
+            msg,
+            (p1.nonce_commitment_pair, (Point(), Point()), p3.nonce_commitment_pair),
+            participant_indexes,
+        )
+        message, nonce_commitment_pairs = agg.signing_inputs()
+
+        s3 = p3.sign(message, nonce_commitment_pairs, participant_indexes)
+        s1 = p1.sign(message, nonce_commitment_pairs, participant_indexes)
+
+        sig = agg.signature(
+            (s3, s1),
+            (p3.public_verification_share(), p1.public_verification_share()),
+        )
+        sig_bytes = bytes.fromhex(sig)
+        nonce_commitment = Point.xonly_deserialize(sig_bytes[0:32].hex())
+        z = int.from_bytes(sig_bytes[32:64], "big")
+
+        self.assertEqual(
+            nonce_commitment.x,
+            Aggregator.group_commitment(
+                msg, nonce_commitment_pairs, participant_indexes
+            ).x,
+        )
+
+        # c = H_2(R, Y, m)
+        challenge_hash = Aggregator.challenge_hash(nonce_commitment, pk, msg)
+        # Negate Y if Y.y is odd
+        if pk.y % 2 != 0:
+            pk = -pk
+
+        # R ≟ g^z * Y^-c
+        self.assertTrue(nonce_commitment == (z * G) + (Q - challenge_hash) * pk)
+
+    def test_signature_after_message_change(self):
+        p1 = self.p1
+        p2 = self.p2
+
+        pk = p1.public_key
+        participant_indexes = (1, 2)
+
+        p1.generate_nonce_pair()
+        p2.generate_nonce_pair()
+        agg = Aggregator(
+            pk,
+            b"fnord!",
+            (p1.nonce_commitment_pair, p2.nonce_commitment_pair),
+            participant_indexes,
+        )
+        message, nonce_commitment_pairs = agg.signing_inputs()
+        s1 = p1.sign(message, nonce_commitment_pairs, participant_indexes)
+        s2 = p2.sign(message, nonce_commitment_pairs, participant_indexes)
+        public_verification_shares = (
+            p1.public_verification_share(),
+            p2.public_verification_share(),
+        )
+        agg.signature((s1, s2), public_verification_shares)
+
+        # Changing the message changes the binding values and hence R
+        agg.message = b"other message"
+        nonce_commitment = Aggregator.group_commitment(
+            agg.message, nonce_commitment_pairs, participant_indexes
+        )
+        sig = agg.signature((s1, s2))
+        self.assertEqual(bytes.fromhex(sig)[0:32], nonce_commitment.xonly_serialize())
+        with self.assertRaises(ValueError):
+            agg.signature((s1, s2), public_verification_shares)